@@ -3,6 +3,9 @@ import json
 import random
 import google.generativeai as genai
 
+from main import create_video_from_topic
+from utility.script.script_generator import generate_scripts
+
 # --- Configuration: Ensure API Key is set ---
 try:
     genai.configure(api_key=os.environ["GEMINI_API_KEY"])
@@ -25,7 +28,8 @@ Your task is to generate a list of topics that fit these criteria:
 Strictly output a single, raw, parsable JSON object. The object must contain one key, "topics", which is an array of 5 unique topic strings. Do not add any other text, explanations, or markdown.
 
 # Example of your perfect output:
-{"topic": ["The Secret History of Suburbs"]}
+{"topics": ["The Secret History of Suburbs", "Why Bananas Are Radioactive", "The Hidden Purpose of Airplane Window Holes", "How Pencils Got Their Number", "The Truth About Daddy Longlegs"]}
+"""
 
 topic_generator_model = genai.GenerativeModel(
     model_name="gemini-1.5-flash-latest",
@@ -34,3 +38,43 @@ topic_generator_model = genai.GenerativeModel(
         response_mime_type="application/json"
     )
 )
+
+
+def generate_topics() -> list[str]:
+    """
+    Asks the topic strategist for a fresh batch of viral topic ideas.
+
+    Returns:
+        A list of unique topic strings (empty if the model's response was unusable).
+    """
+    print("🧠 Brainstorming viral topics...")
+    try:
+        response = topic_generator_model.generate_content(
+            f"Generate 5 new viral topic ideas. Random seed: {random.randint(0, 1_000_000)}"
+        )
+        topics = json.loads(response.text).get("topics", [])
+    except Exception as e:
+        print(f"❌ Topic generation failed: {e}")
+        return []
+
+    unique_topics = []
+    for topic in topics:
+        if isinstance(topic, str) and topic.strip() and topic.strip() not in unique_topics:
+            unique_topics.append(topic.strip())
+    return unique_topics
+
+
+if __name__ == "__main__":
+    topics = generate_topics()
+    if not topics:
+        print("❌ No topics generated. Exiting.")
+        exit(1)
+
+    # One LLM call covers every topic; failed topics are retried on their own
+    # and skipped if they still fail, so no error text is ever narrated.
+    scripts = generate_scripts(topics)
+    for topic, script in zip(topics, scripts):
+        if not script:
+            print(f"⚠️ Skipping topic without a valid script: '{topic}'")
+            continue
+        create_video_from_topic(topic, script=script)
@@ -1,6 +1,6 @@
 # main.py
 
-import sys, os, shutil
+import sys, os, shutil, uuid
 from datetime import datetime
 
 # Import all necessary utility functions
@@ -17,8 +17,6 @@ except ImportError as e:
 
 # --- Configuration ---
 TEMP_DIR = "temp_processing_files"
-TEMP_VIDEO_DIR = os.path.join(TEMP_DIR, "clips")
-TEMP_AUDIO_PATH = os.path.join(TEMP_DIR, "voiceover.mp3")
 FINAL_VIDEO_DIR = "final_videos"
 SCENE_DURATION_SECONDS = 5
 
@@ -73,40 +71,61 @@ def group_captions_into_scenes(raw_timed_captions: list, scene_duration: int) ->
         
     return scenes
 
-def create_video_from_topic(topic: str):
+def create_video_from_topic(topic: str, script: str | None = None, work_dir: str = TEMP_DIR, progress=None) -> str | None:
     """
     Orchestrates the entire video creation pipeline with scene grouping.
+    If a pre-generated script is passed (e.g. from a batch), it is used as-is.
+
+    Args:
+        topic: The subject for the video.
+        script: An optional, already generated script.
+        work_dir: Scratch directory for this run. It is wiped before and after,
+            so concurrent runs (e.g. in worker.py) must each use their own.
+        progress: Optional callback `progress(stage, message)` for stage events.
+
+    Returns:
+        The final video path if successful, otherwise None.
     """
+    def report(stage: str, message: str):
+        print(message)
+        if progress: progress(stage, message.strip())
+
     # --- Setup ---
-    if os.path.isdir(TEMP_DIR): shutil.rmtree(TEMP_DIR)
-    os.makedirs(TEMP_VIDEO_DIR, exist_ok=True)
+    clips_dir = os.path.join(work_dir, "clips")
+    generated_dir = os.path.join(work_dir, "generated")
+    if os.path.isdir(work_dir): shutil.rmtree(work_dir)
+    os.makedirs(clips_dir, exist_ok=True)
+    os.makedirs(generated_dir, exist_ok=True)
     os.makedirs(FINAL_VIDEO_DIR, exist_ok=True)
     
     print(f"🎬 Starting video creation process for topic: '{topic}'")
+    final_video_path = None
     
     try:
         # --- Part 1: Generate Script, Audio, and Granular Captions ---
-        print("\n[1/4] Generating script, audio, and detailed captions...")
-        full_script_text = generate_script(topic)
-        audio_path = generate_audio(full_script_text, TEMP_AUDIO_PATH)
+        report("script", "\n[1/4] Generating script, audio, and detailed captions...")
+        full_script_text = script or generate_script(topic)
+        if not full_script_text: raise ValueError("Script generation failed.")
+        audio_path = generate_audio(full_script_text, os.path.join(work_dir, "voiceover.mp3"))
+        if not audio_path: raise ValueError("Audio generation failed.")
         # This returns the raw tuple data: [((start, end), text), ...]
         raw_captions = generate_timed_captions(audio_path)
         if not raw_captions: raise ValueError("Caption generation failed.")
-        print(f"   ✅ Generated {len(raw_captions)} granular caption segments.")
+        report("captions", f"   ✅ Generated {len(raw_captions)} granular caption segments.")
 
         # --- Part 2: Group Captions and Generate Background Videos ---
-        print(f"\n[2/4] Grouping captions into {SCENE_DURATION_SECONDS}-second scenes and generating backgrounds...")
+        report("backgrounds", f"\n[2/4] Grouping captions into {SCENE_DURATION_SECONDS}-second scenes and generating backgrounds...")
         # This function now correctly processes the raw tuple data
         grouped_scenes = group_captions_into_scenes(raw_captions, SCENE_DURATION_SECONDS)
         
         for i, scene in enumerate(grouped_scenes):
-            print(f"\n   --- Scene {i+1}/{len(grouped_scenes)} (Time: {scene['start']:.2f}s - {scene['end']:.2f}s) ---")
+            report("scene", f"\n   --- Scene {i+1}/{len(grouped_scenes)} (Time: {scene['start']:.2f}s - {scene['end']:.2f}s) ---")
             visual_prompt = generate_search_query(full_script_text, scene['prompt_text'])
             print(f"   Context-Aware Prompt: '{visual_prompt}'")
             
-            clip_path = generate_video_clip(visual_prompt)
+            clip_path = generate_video_clip(visual_prompt, output_dir=generated_dir)
             if clip_path:
-                final_clip_path = os.path.join(TEMP_VIDEO_DIR, os.path.basename(clip_path))
+                final_clip_path = os.path.join(clips_dir, os.path.basename(clip_path))
                 shutil.move(clip_path, final_clip_path)
                 scene['video_path'] = final_clip_path
                 print(f"   ✅ Background video generated for scene.")
@@ -118,21 +137,23 @@ def create_video_from_topic(topic: str):
         if not scenes_for_render: raise ValueError("All background video generations failed.")
 
         # --- Part 3 & 4: Rendering & Cleanup ---
-        print("\n[3/4] Rendering final video with grouped scenes and captions...")
+        report("render", "\n[3/4] Rendering final video with grouped scenes and captions...")
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        final_video_path = os.path.join(FINAL_VIDEO_DIR, f"video_{timestamp}.mp4")
+        output_path = os.path.join(FINAL_VIDEO_DIR, f"video_{timestamp}_{uuid.uuid4().hex[:8]}.mp4")
         
-        render_video(scenes=scenes_for_render, audio_path=audio_path, output_path=final_video_path)
-        print(f"\n🎉 SUCCESS! Final video saved to: {final_video_path}")
+        render_video(scenes=scenes_for_render, audio_path=audio_path, output_path=output_path)
+        final_video_path = output_path
+        report("done", f"\n🎉 SUCCESS! Final video saved to: {final_video_path}")
 
     except Exception as e:
-        print(f"\n❌ A critical error occurred: {e}")
+        report("error", f"\n❌ A critical error occurred: {e}")
     finally:
         print("\n[4/4] Cleaning up temporary files...")
-        if os.path.isdir(TEMP_DIR): shutil.rmtree(TEMP_DIR)
-        if os.path.isdir("generated_videos"): shutil.rmtree("generated_videos")
+        if os.path.isdir(work_dir): shutil.rmtree(work_dir)
         print("   ✅ Cleanup complete.")
 
+    return final_video_path
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         input_topic = sys.argv[1]
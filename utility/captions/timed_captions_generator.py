@@ -2,11 +2,22 @@
 
 import whisper_timestamped as whisper
 import re
+import threading
+from functools import lru_cache
+
+# Whisper models are expensive to load, so each size is loaded once per process
+# and shared. Transcription is serialized because the model is not thread-safe.
+_transcribe_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def load_whisper_model(model_size="base"):
+    return whisper.load_model(model_size, device="cpu")
 
 # This function is the main entry point for the module.
 def generate_timed_captions(audio_filename, model_size="base"):
-    model = whisper.load_model(model_size, device="cpu")
-    result = whisper.transcribe_timestamped(model, audio_filename, verbose=False, fp16=False)
+    model = load_whisper_model(model_size)
+    with _transcribe_lock:
+        result = whisper.transcribe_timestamped(model, audio_filename, verbose=False, fp16=False)
     # The output of getCaptionsWithTime is what we will work with.
     return getCaptionsWithTime(result)
 
@@ -1,6 +1,7 @@
 # utility/render/render_engine.py
 
 import os
+from functools import lru_cache
 from moviepy.editor import (VideoFileClip, AudioFileClip, ImageClip, CompositeVideoClip, concatenate_videoclips)
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np # <-- 1. IMPORT NUMPY
@@ -10,6 +11,11 @@ FONT_FILE = 'Montserrat-Bold.ttf'
 FONT_SIZE = 80
 VIDEO_RESOLUTION = (1080, 1920)
 
+@lru_cache(maxsize=None)
+def load_font(font_file: str = FONT_FILE, font_size: int = FONT_SIZE):
+    """Loads a caption font once per process and reuses it for every caption."""
+    return ImageFont.truetype(font_file, font_size)
+
 def render_video(scenes: list, audio_path: str, output_path: str):
     """
     Renders the final video from grouped scenes.
@@ -37,7 +43,7 @@ def render_video(scenes: list, audio_path: str, output_path: str):
                 
                 canvas = Image.new('RGBA', VIDEO_RESOLUTION, (0, 0, 0, 0))
                 draw = ImageDraw.Draw(canvas)
-                font = ImageFont.truetype(FONT_FILE, FONT_SIZE)
+                font = load_font()
                 
                 text_box = draw.textbbox((0,0), caption_data['text'], font=font, align="center")
                 text_width, text_height = text_box[2] - text_box[0], text_box[3] - text_box[1]
@@ -13,14 +13,13 @@ except KeyError:
     exit()
 
 # 2. Define the System Instructions for the AI
-#    This tells the model its role, rules, and output format.
-SYSTEM_INSTRUCTIONS = """You are a seasoned content writer for a YouTube Shorts channel specializing in facts videos.
+#    The persona and writing rules are shared; each model then adds its own
+#    task description and output format.
+SCRIPT_WRITER_INSTRUCTIONS = """You are a seasoned content writer for a YouTube Shorts channel specializing in facts videos.
 Your facts shorts are concise, each lasting less than 50 seconds (approximately 140 words).
 They are incredibly engaging and original.
 
-When a user provides a topic for a facts short, you will create a script for it.
-
-For instance, if the user's topic is "Weird facts", you would produce content like this:
+For instance, for the topic "Weird facts", you would produce content like this:
 
 Weird facts you don't know:
 - Bananas are berries, but strawberries aren't.
@@ -30,8 +29,11 @@ Weird facts you don't know:
 - The shortest war in history was between Britain and Zanzibar on August 27, 1896. Zanzibar surrendered after 38 minutes.
 - Octopuses have three hearts and blue blood.
 
-You are now tasked with creating the best short script based on the user's requested topic.
-Keep it brief, highly interesting, and unique.
+Keep every script brief, highly interesting, and unique.
+"""
+
+SYSTEM_INSTRUCTIONS = SCRIPT_WRITER_INSTRUCTIONS + """
+When a user provides a topic for a facts short, you will create the best short script for it.
 
 Strictly output the script in a JSON format like below. Only provide a single, parsable JSON object with the key 'script'. Do not add any other text or formatting before or after the JSON.
 
@@ -50,7 +52,27 @@ model = genai.GenerativeModel(
     )
 )
 
-def generate_script(topic: str) -> str:
+# 4. Batch variant: one call returns a script for each of several topics.
+#    Topics are numbered in the prompt and echoed back as "id", so each
+#    script can be matched to its topic and validated independently.
+BATCH_SYSTEM_INSTRUCTIONS = SCRIPT_WRITER_INSTRUCTIONS + """
+When the user provides a numbered list of topics, you will create one separate, self-contained script for every topic.
+
+Strictly output a single, parsable JSON object with the key 'scripts', an array containing one object per topic with the keys 'id' (the topic's number as an integer) and 'script'. Do not add any other text or formatting before or after the JSON.
+
+# Example Output
+{"scripts": [{"id": 0, "script": "Here is the first script..."}, {"id": 1, "script": "Here is the second script..."}]}
+"""
+
+batch_model = genai.GenerativeModel(
+    model_name="gemini-2.0-flash-lite",
+    system_instruction=BATCH_SYSTEM_INSTRUCTIONS,
+    generation_config=genai.types.GenerationConfig(
+        response_mime_type="application/json"
+    )
+)
+
+def generate_script(topic: str) -> str | None:
     """
     Generates a YouTube Shorts script for a given topic using Gemini.
 
@@ -58,7 +80,7 @@ def generate_script(topic: str) -> str:
         topic: The subject for the facts video (e.g., "Space Facts").
 
     Returns:
-        The generated script as a string, or an error message.
+        The generated script as a string, or None if generation failed.
     """
     print(f"Generating script for topic: '{topic}'...")
     
@@ -71,13 +93,115 @@ def generate_script(topic: str) -> str:
         # The API's JSON mode helps ensure the response is valid JSON.
         # We parse the text content of the response.
         script_data = json.loads(response.text)
-        
-        return script_data.get("script", "Error: 'script' key not found in response.")
+
+        script = _clean_script(script_data.get("script"))
+        if script is None:
+            print("---ERROR: 'script' key missing or empty in the model's response.---")
+        return script
 
     except json.JSONDecodeError:
         print("---ERROR: Failed to decode JSON from the model's response.---")
         print("Model Response Text:", response.text)
-        return "Error: Could not parse the script from the AI's response."
+        return None
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
-        return "Error: An unexpected error occurred during script generation."
+        return None
+
+
+def _clean_script(script) -> str | None:
+    """INTERNAL FUNCTION: Returns the stripped script, or None if it is not usable for narration."""
+    if not isinstance(script, str):
+        return None
+    script = script.strip()
+    return script or None
+
+
+def _request_script_batch(topics: list[str]) -> dict[int, str] | None:
+    """
+    INTERNAL FUNCTION: Asks the batch model for one script per topic in a single call.
+
+    Returns:
+        A mapping of topic index -> validated script. Indexes that are missing,
+        duplicated or invalid in the response are simply left out. Returns None
+        if the response as a whole could not be parsed (e.g. it was cut off).
+    """
+    numbered_topics = "\n".join(f"{i}. {topic}" for i, topic in enumerate(topics))
+    prompt = f"Create a YouTube facts short for each of these topics:\n{numbered_topics}"
+
+    response = batch_model.generate_content(prompt)
+    try:
+        batch_data = json.loads(response.text)
+    except json.JSONDecodeError:
+        print("---ERROR: Failed to decode JSON from the model's batch response.---")
+        print("Model Response Text:", response.text)
+        return None
+
+    entries = batch_data.get("scripts") if isinstance(batch_data, dict) else None
+    if not isinstance(entries, list):
+        print("---ERROR: 'scripts' array missing in the model's batch response.---")
+        return None
+
+    scripts = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        index = entry.get("id")
+        # bool is a subclass of int, so JSON true/false must be rejected explicitly.
+        if type(index) is not int or not 0 <= index < len(topics) or index in scripts:
+            continue
+        script = _clean_script(entry.get("script"))
+        if script is not None:
+            scripts[index] = script
+    return scripts
+
+
+def generate_scripts(topics: list[str], batch_size: int = 5, max_retries: int = 1) -> list[str | None]:
+    """
+    Generates YouTube Shorts scripts for several topics, `batch_size` topics per Gemini call.
+
+    Each script in a response is validated on its own. Only the topics whose
+    script was missing or invalid are sent again, up to `max_retries` times.
+    If a whole response could not be parsed, that batch is split in half
+    before it is retried, since resending it unchanged would likely fail again.
+
+    Args:
+        topics: The subjects for the facts videos.
+        batch_size: The maximum number of topics sent in one call.
+        max_retries: How many extra rounds of calls to make for failed topics.
+
+    Returns:
+        A list aligned with `topics`, holding each script or None if that
+        topic could not be generated.
+    """
+    batch_size = max(1, batch_size)
+    results: list[str | None] = [None] * len(topics)
+    batches = [list(range(i, min(i + batch_size, len(topics)))) for i in range(0, len(topics), batch_size)]
+
+    for attempt in range(max_retries + 1):
+        if not batches:
+            break
+        retry_batches = []
+        for batch_indexes in batches:
+            print(f"Generating {len(batch_indexes)} script(s) in one batch (attempt {attempt + 1}/{max_retries + 1})...")
+            try:
+                batch = _request_script_batch([topics[i] for i in batch_indexes])
+            except Exception as e:
+                print(f"An unexpected error occurred during batch script generation: {e}")
+                batch = None
+
+            if batch is None:
+                half = (len(batch_indexes) + 1) // 2
+                retry_batches += [b for b in (batch_indexes[:half], batch_indexes[half:]) if b]
+                continue
+
+            for batch_index, script in batch.items():
+                results[batch_indexes[batch_index]] = script
+            failed = [i for i in batch_indexes if results[i] is None]
+            if failed:
+                retry_batches.append(failed)
+        batches = retry_batches
+
+    for i, script in enumerate(results):
+        if script is None:
+            print(f"---ERROR: No valid script generated for topic: '{topics[i]}'---")
+    return results
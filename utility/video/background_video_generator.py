@@ -16,12 +16,11 @@ except Exception as e:
 
 MODEL_NAME = "black-forest-labs/FLUX.1-schnell-Free"
 OUTPUT_DIR = "generated_videos"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
-def _generate_image(prompt: str, width: int = 1008, height: int = 1792) -> str | None:
+def _generate_image(prompt: str, width: int = 1008, height: int = 1792, output_dir: str = OUTPUT_DIR) -> str | None:
     """INTERNAL FUNCTION: Generates a 9:16 vertical image and saves it to a temp file."""
-    temp_image_dir = os.path.join(OUTPUT_DIR, "temp_images")
+    temp_image_dir = os.path.join(output_dir, "temp_images")
     os.makedirs(temp_image_dir, exist_ok=True)
     
     print(f"   🎨 Generating 9:16 image for prompt: '{prompt[:50]}...'")
@@ -83,18 +82,20 @@ def _animate_video(image_path: str, output_video_path: str, resolution: str = "1
         return False
 
 
-def generate_video_clip(prompt: str) -> str | None:
+def generate_video_clip(prompt: str, output_dir: str = OUTPUT_DIR) -> str | None:
     """
     Generates a single, animated 9:16 video clip from a text prompt.
     This is the main public function for this module.
+    Pass a per-job `output_dir` when several jobs run at the same time.
     """
     image_path = None
+    os.makedirs(output_dir, exist_ok=True)
     try:
-        image_path = _generate_image(prompt)
+        image_path = _generate_image(prompt, output_dir=output_dir)
         if not image_path: return None
 
         video_filename = f"{uuid.uuid4()}.mp4"
-        output_video_path = os.path.join(OUTPUT_DIR, video_filename)
+        output_video_path = os.path.join(output_dir, video_filename)
         
         success = _animate_video(image_path, output_video_path)
         
@@ -0,0 +1,260 @@
+# worker.py
+#
+# Long-lived render worker. Imports the whole pipeline, loads the Whisper model
+# and caption font once, then serves jobs over a small local HTTP API:
+#
+#   POST /jobs               {"topic": "...", "script": "..." (optional)} -> 202 {"id": ...}
+#   GET  /jobs               queued, running and recently finished jobs with their status
+#   GET  /jobs/<id>          status, events so far and the final video path
+#   GET  /jobs/<id>/events   streams stage events as JSON lines until the job ends
+#
+# Usage: python worker.py [--host 127.0.0.1] [--port 8765] [--max-concurrent 1] [--max-queue 8] [--keep-finished 50]
+
+import argparse
+import json
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from main import create_video_from_topic
+from utility.captions.timed_captions_generator import load_whisper_model
+from utility.render.render_engine import load_font
+
+# --- Configuration ---
+JOBS_DIR = "worker_jobs"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_CONCURRENT = 1
+DEFAULT_MAX_QUEUE = 8
+DEFAULT_KEEP_FINISHED = 50
+
+FINAL_STATUSES = ("succeeded", "failed")
+
+
+class Job:
+    """A single video request and the progress events it has produced so far."""
+
+    def __init__(self, topic: str, script: str | None = None):
+        self.id = uuid.uuid4().hex
+        self.topic = topic
+        self.script = script
+        self.status = "queued"
+        self.video_path = None
+        self.events = []
+        self.changed = threading.Condition()
+        self.add_event("queued", f"Job queued for topic: '{topic}'")
+
+    def add_event(self, stage: str, message: str):
+        with self.changed:
+            self.events.append({"stage": stage, "message": message, "time": time.time()})
+            self.changed.notify_all()
+
+    def set_status(self, status: str):
+        with self.changed:
+            self.status = status
+            self.changed.notify_all()
+
+    def to_dict(self) -> dict:
+        with self.changed:
+            return {
+                "id": self.id,
+                "topic": self.topic,
+                "status": self.status,
+                "video_path": self.video_path,
+                "events": list(self.events),
+            }
+
+
+class RenderWorker:
+    """Runs queued jobs on a fixed number of threads, sharing the warm pipeline."""
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT, max_queue: int = DEFAULT_MAX_QUEUE,
+                 keep_finished: int = DEFAULT_KEEP_FINISHED):
+        self.jobs = {}
+        self.jobs_lock = threading.Lock()
+        # Only the most recent finished jobs are kept, so a long-running
+        # worker does not hold every job's events forever.
+        self.finished_ids = deque()
+        self.keep_finished = keep_finished
+        self.pending = queue.Queue(maxsize=max_queue)
+        self.threads = [
+            threading.Thread(target=self._run, name=f"render-worker-{i}", daemon=True)
+            for i in range(max_concurrent)
+        ]
+
+    def warm_up(self):
+        """Pays the one-time model and font loading cost before serving any job."""
+        # Job dirs left behind by a previous run that was interrupted mid-render.
+        if os.path.isdir(JOBS_DIR):
+            print(f"🧹 Removing stale job directories in '{JOBS_DIR}'...")
+            shutil.rmtree(JOBS_DIR)
+        print("🔥 Warming up: loading Whisper model and caption font...")
+        load_whisper_model()
+        load_font()
+        print("   ✅ Worker is warm.")
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, topic: str, script: str | None = None) -> Job | None:
+        """Queues a new job, or returns None if the queue is full."""
+        job = Job(topic, script)
+        with self.jobs_lock:
+            try:
+                self.pending.put_nowait(job)
+            except queue.Full:
+                return None
+            self.jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+    def all_jobs(self) -> list[Job]:
+        with self.jobs_lock:
+            return list(self.jobs.values())
+
+    def _run(self):
+        while True:
+            job = self.pending.get()
+            job.set_status("running")
+            try:
+                job.video_path = create_video_from_topic(
+                    job.topic,
+                    script=job.script,
+                    work_dir=os.path.join(JOBS_DIR, job.id),
+                    progress=job.add_event,
+                )
+            except Exception as e:
+                job.add_event("error", f"❌ Worker error: {e}")
+            finally:
+                job.set_status("succeeded" if job.video_path else "failed")
+                self._retire(job)
+                self.pending.task_done()
+
+    def _retire(self, job: Job):
+        """Records a finished job and forgets the oldest ones beyond `keep_finished`."""
+        with self.jobs_lock:
+            self.finished_ids.append(job.id)
+            while len(self.finished_ids) > self.keep_finished:
+                self.jobs.pop(self.finished_ids.popleft(), None)
+
+
+def make_handler(worker: RenderWorker):
+    class JobRequestHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status: int, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if urlsplit(self.path).path.rstrip("/") != "/jobs":
+                return self._send_json(404, {"error": "Not found."})
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+            except (ValueError, json.JSONDecodeError):
+                return self._send_json(400, {"error": "Request body must be a JSON object."})
+
+            topic = request.get("topic") if isinstance(request, dict) else None
+            script = request.get("script") if isinstance(request, dict) else None
+            if not isinstance(topic, str) or not topic.strip():
+                return self._send_json(400, {"error": "'topic' must be a non-empty string."})
+            if script is not None and (not isinstance(script, str) or not script.strip()):
+                return self._send_json(400, {"error": "'script' must be a non-empty string if given."})
+
+            job = worker.submit(topic.strip(), script)
+            if job is None:
+                return self._send_json(503, {"error": "Job queue is full, try again later."})
+            self._send_json(202, {"id": job.id, "status": job.status})
+
+        def do_GET(self):
+            parts = [p for p in urlsplit(self.path).path.split("/") if p]
+            if parts == ["jobs"]:
+                return self._send_json(200, [
+                    {"id": job.id, "topic": job.topic, "status": job.status} for job in worker.all_jobs()
+                ])
+            if len(parts) not in (2, 3) or parts[0] != "jobs":
+                return self._send_json(404, {"error": "Not found."})
+
+            job = worker.get(parts[1])
+            if job is None:
+                return self._send_json(404, {"error": "Unknown job id."})
+            if len(parts) == 2:
+                return self._send_json(200, job.to_dict())
+            if parts[2] == "events":
+                return self._stream_events(job)
+            self._send_json(404, {"error": "Not found."})
+
+        def _stream_events(self, job: Job):
+            """Writes each event as one JSON line, flushing as soon as it happens."""
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            sent = 0
+            while True:
+                with job.changed:
+                    while sent == len(job.events) and job.status not in FINAL_STATUSES:
+                        job.changed.wait()
+                    new_events = job.events[sent:]
+                    finished = job.status in FINAL_STATUSES
+                try:
+                    for event in new_events:
+                        self.wfile.write((json.dumps(event) + "\n").encode("utf-8"))
+                    if finished:
+                        summary = {"stage": "finished", "status": job.status, "video_path": job.video_path}
+                        self.wfile.write((json.dumps(summary) + "\n").encode("utf-8"))
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                sent += len(new_events)
+                if finished:
+                    return
+
+    return JobRequestHandler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resident Text-To-Video render worker.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-concurrent", type=int, default=DEFAULT_MAX_CONCURRENT,
+                        help="Number of jobs rendered at the same time.")
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE,
+                        help="Number of waiting jobs accepted before returning 503.")
+    parser.add_argument("--keep-finished", type=int, default=DEFAULT_KEEP_FINISHED,
+                        help="Number of finished jobs kept for status queries.")
+    args = parser.parse_args()
+    if args.max_concurrent < 1 or args.max_queue < 1 or args.keep_finished < 1:
+        print("❌ --max-concurrent, --max-queue and --keep-finished must be at least 1.")
+        sys.exit(1)
+
+    worker = RenderWorker(max_concurrent=args.max_concurrent, max_queue=args.max_queue,
+                          keep_finished=args.keep_finished)
+    worker.warm_up()
+    worker.start()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(worker))
+    server.daemon_threads = True
+    print(f"🚀 Render worker listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down render worker.")
+    finally:
+        server.server_close()